@@ -5,20 +5,48 @@ Tasks can be added, updated, deleted, marked as in-progress or done, and listed.
 """
 
 import argparse
-import json
+import atexit
+import os
+import pickle
+import sys
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional
+
+import orjson
 
 TASKS_FILE = "tasks.json"
+READ_BUFFER_BYTES = 65536
+JOURNAL_COMPACT_BYTES = 1 << 20
+
+STATUS_TODO = sys.intern("todo")
+STATUS_IN_PROGRESS = sys.intern("in-progress")
+STATUS_DONE = sys.intern("done")
+
+_now_cache: list = [0, ""]
+
+def _now_iso() -> str:
+    """Return the current time in ISO format, cached per second.
+
+    Returns:
+        str: The current timestamp with second granularity.
+
+    """
+    second = int(time.time())
+    if second != _now_cache[0]:
+        _now_cache[:] = [second, datetime.fromtimestamp(second).isoformat()]
+    return _now_cache[1]
 
 class TaskManager:
     """A class to manage tasks.
 
     Attributes:
         tasks_file (str): The path to the tasks file.
-        load_tasks(): Loads tasks from the tasks file.
-        save_tasks(): Saves the current list of tasks to the tasks file.
+        journal_file (str): The path to the append-only mutation journal.
+        load_tasks(): Loads tasks from the tasks file and replays the journal.
+        save_tasks(record): Appends a mutation record to the journal.
+        compact(): Writes the full task list and resets the journal.
         add_task(description): Adds a new task to the task list.
         update_task(task_id, description): Updates the description of an existing task.
         delete_task(task_id): Deletes a task by its ID.
@@ -39,33 +67,210 @@ class TaskManager:
 
         """
         self.tasks_file = tasks_file
-        self.tasks = self.load_tasks()
+        self.journal_file = str(Path(tasks_file).with_suffix(".log"))
+        self.cache_file = str(Path(tasks_file).with_suffix(".cache"))
+        self._by_id: Optional[dict] = None
+        self._next_id = 0
+        self._journal: Optional[BinaryIO] = None
+        self._dirty = False
+        self._load_failed = False
+
+    def _ensure_loaded(self) -> None:
+        """Load tasks from disk on first use.
+
+        Returns:
+            None
+
+        """
+        if self._by_id is None:
+            self.tasks = self.load_tasks()
+
+    @property
+    def journal(self) -> BinaryIO:
+        """Return the journal file handle, opening it on first use.
+
+        Returns:
+            BinaryIO: The append-mode journal file handle.
+
+        """
+        if self._journal is None:
+            self._journal = Path(self.journal_file).open("ab", buffering=0)
+        return self._journal
+
+    @property
+    def tasks(self) -> list:
+        """Return the tasks in insertion order.
+
+        Returns:
+            list: The current list of tasks.
+
+        """
+        self._ensure_loaded()
+        return list(self._by_id.values())
+
+    @tasks.setter
+    def tasks(self, tasks: list) -> None:
+        """Replace the task store and rebuild the id index.
+
+        Args:
+            tasks (list): The new list of tasks.
+
+        Returns:
+            None
+
+        """
+        for task in tasks:
+            task["status"] = sys.intern(task["status"])
+        self._by_id = {task["id"]: task for task in tasks}
+        self._next_id = max(self._by_id, default=0)
+        self._by_status: dict = {
+            STATUS_TODO: [],
+            STATUS_IN_PROGRESS: [],
+            STATUS_DONE: [],
+        }
+        for task in tasks:
+            self._by_status.setdefault(task["status"], []).append(task["id"])
 
     def load_tasks(self) -> list:
-        """Load tasks from the tasks file.
+        """Load tasks from the tasks file and replay the journal.
 
         Returns:
             list: A list of tasks loaded from the file.
 
         """
-        if not Path(self.tasks_file).exists():
-            return []
-        with Path(self.tasks_file).open("r") as file:
-            try:
-                return json.load(file)
-            except json.JSONDecodeError:
-                print("Error: The tasks file contains invalid JSON.")
-                return []
-
-    def save_tasks(self) -> None:
-        """Save the current list of tasks to the tasks file.
+        tasks = []
+        if Path(self.tasks_file).exists():
+            tasks = self._load_cache()
+            if tasks is None:
+                with Path(self.tasks_file).open("rb", buffering=READ_BUFFER_BYTES) as file:
+                    try:
+                        tasks = orjson.loads(file.read())
+                    except orjson.JSONDecodeError:
+                        print("Error: The tasks file contains invalid JSON.")
+                        self._load_failed = True
+                        return []
+                Path(self.cache_file).write_bytes(pickle.dumps(tasks, protocol=5))
+        if Path(self.journal_file).exists():
+            with Path(self.journal_file).open("rb", buffering=READ_BUFFER_BYTES) as file:
+                for line in file:
+                    if not line.strip():
+                        continue
+                    try:
+                        self._replay(tasks, orjson.loads(line))
+                    except (orjson.JSONDecodeError, KeyError):
+                        # A torn final append, e.g. from a process killed
+                        # mid-write; the decoded prefix is the durable state.
+                        break
+        return tasks
+
+    def _set_status(self, task: dict, status: str) -> None:
+        """Move a task to a new status bucket.
+
+        Args:
+            task (dict): The task to move.
+            status (str): The interned status to assign.
 
         Returns:
             None
 
         """
-        with Path(self.tasks_file).open("w") as file:
-            json.dump(self.tasks, file, indent=4)
+        if task["status"] is status:
+            return
+        self._by_status[task["status"]].remove(task["id"])
+        self._by_status.setdefault(status, []).append(task["id"])
+        task["status"] = status
+
+    def _load_cache(self) -> Optional[list]:
+        """Load tasks from the binary cache if it is still fresh.
+
+        Returns:
+            Optional[list]: The cached task list, or None when the cache
+                is missing, older than the tasks file, or unreadable.
+
+        """
+        cache_path = Path(self.cache_file)
+        if not cache_path.exists():
+            return None
+        if cache_path.stat().st_mtime < Path(self.tasks_file).stat().st_mtime:
+            return None
+        try:
+            return pickle.loads(cache_path.read_bytes())
+        except (pickle.UnpicklingError, EOFError):
+            return None
+
+    @staticmethod
+    def _replay(tasks: list, record: dict) -> None:
+        """Apply a single journal record to a task list.
+
+        Args:
+            tasks (list): The task list to mutate.
+            record (dict): A journal record with an "op" key.
+
+        Returns:
+            None
+
+        """
+        op = record["op"]
+        if op == "add":
+            new_task = record["task"]
+            for index, task in enumerate(tasks):
+                if task["id"] == new_task["id"]:
+                    tasks[index] = new_task
+                    return
+            tasks.append(new_task)
+        elif op == "update":
+            for task in tasks:
+                if task["id"] == record["id"]:
+                    task.update(record["fields"])
+                    return
+        elif op == "delete":
+            tasks[:] = [task for task in tasks if task["id"] != record["id"]]
+
+    def save_tasks(self, record: Optional[dict] = None) -> None:
+        """Record a mutation in the journal, or compact when called bare.
+
+        Args:
+            record (Optional[dict], optional): The journal record describing
+                the mutation. Defaults to None, which compacts to the tasks
+                file instead.
+
+        Returns:
+            None
+
+        """
+        if record is None:
+            self.compact()
+            return
+        self._dirty = True
+        self.journal.write(orjson.dumps(record) + b"\n")
+        if self.journal.tell() > JOURNAL_COMPACT_BYTES:
+            self.compact()
+
+    def compact(self) -> None:
+        """Atomically write the full task list to the tasks file and reset the journal.
+
+        The list is written compact to a temporary file and swapped into
+        place with os.replace, so a crash mid-write never leaves a
+        half-written tasks file. Does nothing if the tasks were never
+        loaded, nothing changed since the last compaction, or the tasks
+        file failed to load, so a read-only run rewrites nothing and a
+        corrupt tasks file is never overwritten.
+
+        Returns:
+            None
+
+        """
+        if self._by_id is None or not self._dirty or self._load_failed:
+            return
+        tasks = self.tasks
+        tmp_file = self.tasks_file + ".tmp"
+        with Path(tmp_file).open("wb") as file:
+            file.write(orjson.dumps(tasks))
+        os.replace(tmp_file, self.tasks_file)
+        Path(self.cache_file).write_bytes(pickle.dumps(tasks, protocol=5))
+        self.journal.seek(0)
+        self.journal.truncate()
+        self._dirty = False
 
     def add_task(self, description: str) -> None:
         """Add a new task to the task list.
@@ -80,16 +285,20 @@ class TaskManager:
         if not description.strip():
             print("Task description cannot be empty.")
             return
-        task_id = max([task["id"] for task in self.tasks], default=0) + 1
-        current_time = datetime.now().isoformat()
-        self.tasks.append({
+        self._ensure_loaded()
+        self._next_id += 1
+        task_id = self._next_id
+        current_time = _now_iso()
+        task = {
             "id": task_id,
             "description": description,
-            "status": "todo",
+            "status": STATUS_TODO,
             "createdAt": current_time,
             "updatedAt": current_time,
-        })
-        self.save_tasks()
+        }
+        self._by_id[task_id] = task
+        self._by_status[STATUS_TODO].append(task_id)
+        self.save_tasks({"op": "add", "task": task})
         print(f"Task added: {description}")
 
     def update_task(self, task_id: int, description: str) -> None:
@@ -103,15 +312,17 @@ class TaskManager:
             None
 
         """
-        for task in self.tasks:
-            if task["id"] == task_id:
-                if description.strip():
-                    task["description"] = description
-                task["updatedAt"] = datetime.now().isoformat()
-                self.save_tasks()
-                print(f"Task updated: {task}")
-                return
-        print("Task not found.")
+        self._ensure_loaded()
+        task = self._by_id.get(task_id)
+        if task is None:
+            print("Task not found.")
+            return
+        fields = {"updatedAt": _now_iso()}
+        if description.strip():
+            fields["description"] = description
+        task.update(fields)
+        self.save_tasks({"op": "update", "id": task_id, "fields": fields})
+        print(f"Task updated: {task}")
 
     def delete_task(self, task_id: int) -> None:
         """Delete a task by its ID.
@@ -123,11 +334,13 @@ class TaskManager:
             None
 
         """
-        if not any(task["id"] == task_id for task in self.tasks):
+        self._ensure_loaded()
+        task = self._by_id.pop(task_id, None)
+        if task is None:
             print("Task not found.")
             return
-        self.tasks = [task for task in self.tasks if task["id"] != task_id]
-        self.save_tasks()
+        self._by_status[task["status"]].remove(task_id)
+        self.save_tasks({"op": "delete", "id": task_id})
         print(f"Task {task_id} deleted.")
 
     def mark_task_in_progress(self, task_id: int) -> None:
@@ -140,13 +353,18 @@ class TaskManager:
             None
 
         """
-        for task in self.tasks:
-            if task["id"] == task_id:
-                task["status"] = "in-progress"
-                self.save_tasks()
-                print(f"Task {task_id} marked as in-progress.")
-                return
-        print("Task not found.")
+        self._ensure_loaded()
+        task = self._by_id.get(task_id)
+        if task is None:
+            print("Task not found.")
+            return
+        self._set_status(task, STATUS_IN_PROGRESS)
+        self.save_tasks({
+            "op": "update",
+            "id": task_id,
+            "fields": {"status": "in-progress"},
+        })
+        print(f"Task {task_id} marked as in-progress.")
 
     def mark_task_done(self, task_id: int) -> None:
         """Mark a task as done by its ID.
@@ -158,16 +376,18 @@ class TaskManager:
             None
 
         """
-        if not any(task["id"] == task_id for task in self.tasks):
+        self._ensure_loaded()
+        task = self._by_id.get(task_id)
+        if task is None:
             print("Task not found.")
             return
-        for task in self.tasks:
-            if task["id"] == task_id:
-                task["status"] = "done"
-                self.save_tasks()
-                print(f"Task {task_id} marked as done.")
-                return
-        print("Task not found.")
+        self._set_status(task, STATUS_DONE)
+        self.save_tasks({
+            "op": "update",
+            "id": task_id,
+            "fields": {"status": "done"},
+        })
+        print(f"Task {task_id} marked as done.")
 
     def list_tasks(self, status: Optional[str] = None) -> None:
         """List tasks, optionally filtered by status.
@@ -179,18 +399,37 @@ class TaskManager:
             None
 
         """
-        filtered_tasks = self.tasks
         if status:
-            filtered_tasks = [task for task in self.tasks if task["status"] == status]
-        for task in filtered_tasks:
-            print(f"ID: {task['id']}")
-            print(f"Description: {task['description']}")
-            print(f"Status: {task['status']}")
-            print(f"Created At: {task['createdAt']}")
-            print(f"Updated At: {task['updatedAt']}")
-            print()
+            status = sys.intern(status)
+            self._ensure_loaded()
+            filtered_tasks = [
+                self._by_id[task_id]
+                for task_id in self._by_status.get(status, [])
+            ]
+        else:
+            filtered_tasks = self.tasks
         if not filtered_tasks:
             print("No tasks found.")
+            return
+        lines = []
+        for task in filtered_tasks:
+            lines.append(
+                f"ID: {task['id']}\n"
+                f"Description: {task['description']}\n"
+                f"Status: {task['status']}\n"
+                f"Created At: {task['createdAt']}\n"
+                f"Updated At: {task['updatedAt']}\n\n"
+            )
+        sys.stdout.write("".join(lines))
+
+DISPATCH = {
+    "add": lambda manager, args: manager.add_task(args.description),
+    "update": lambda manager, args: manager.update_task(args.id, args.description),
+    "delete": lambda manager, args: manager.delete_task(args.id),
+    "mark-in-progress": lambda manager, args: manager.mark_task_in_progress(args.id),
+    "mark-done": lambda manager, args: manager.mark_task_done(args.id),
+    "list": lambda manager, args: manager.list_tasks(args.status),
+}
 
 def main() -> None:
     """Run main function to run the Task Tracker CLI.
@@ -200,6 +439,7 @@ def main() -> None:
 
     """
     task_manager = TaskManager()
+    atexit.register(task_manager.compact)
 
     parser = argparse.ArgumentParser(description="Task Tracker CLI")
     subparsers = parser.add_subparsers(dest="command")
@@ -241,20 +481,11 @@ def main() -> None:
 
     args = parser.parse_args()
 
-    if args.command == "add":
-        task_manager.add_task(args.description)
-    elif args.command == "update":
-        task_manager.update_task(args.id, args.description)
-    elif args.command == "delete":
-        task_manager.delete_task(args.id)
-    elif args.command == "mark-in-progress":
-        task_manager.mark_task_in_progress(args.id)
-    elif args.command == "mark-done":
-        task_manager.mark_task_done(args.id)
-    elif args.command == "list":
-        task_manager.list_tasks(args.status)
-    else:
+    command = DISPATCH.get(args.command)
+    if command is None:
         parser.print_help()
+        return
+    command(task_manager, args)
 
 if __name__ == "__main__":
     main()
@@ -1,5 +1,7 @@
 """Test suite for TaskManager."""
 
+import json
+import os
 from pathlib import Path
 
 import pytest
@@ -96,6 +98,14 @@ def test_list_tasks_by_status(task_manager: TaskManager, capsys: CaptureFixture[
     assert "Task 1 marked as done" not in captured.out
     assert "Task 2 marked as done" in captured.out
 
+def test_list_tasks_by_status_after_transition(task_manager: TaskManager, capsys: CaptureFixture[str]) -> None:
+    """Test that status-filtered listing tracks status changes."""
+    task_manager.add_task("Test Task 1")
+    task_manager.mark_task_in_progress(1)
+    task_manager.list_tasks(status="todo")
+    captured = capsys.readouterr()
+    assert "No tasks found." in captured.out
+
 def test_load_tasks(task_manager: TaskManager) -> None:
     """Test loading tasks from file."""
     task_manager.add_task("Test Task 1")
@@ -112,10 +122,71 @@ def test_save_tasks(task_manager: TaskManager) -> None:
         data = file.read()
     assert "Test Task 1" in data
 
+def test_load_tasks_from_cache(task_manager: TaskManager, capsys: CaptureFixture[str]) -> None:
+    """Test loading tasks from the binary cache instead of the JSON file."""
+    task_manager.add_task("Test Task 1")
+    task_manager.save_tasks()
+    assert Path("test_tasks.cache").exists()
+    # Corrupt the JSON file and keep the cache fresher: a successful load
+    # can then only have come from the cache.
+    Path("test_tasks.json").write_text("not valid json")
+    os.utime("test_tasks.cache")
+    capsys.readouterr()
+    new_manager = TaskManager(tasks_file="test_tasks.json")
+    assert len(new_manager.tasks) == 1
+    assert new_manager.tasks[0]["description"] == "Test Task 1"
+    captured = capsys.readouterr()
+    assert "Error: The tasks file contains invalid JSON." not in captured.out
+
+def test_journal_replay(task_manager: TaskManager) -> None:
+    """Test replaying journaled mutations without a compaction."""
+    task_manager.add_task("Test Task 1")
+    task_manager.save_tasks()
+    task_manager.mark_task_done(1)
+    new_manager = TaskManager(tasks_file="test_tasks.json")
+    assert len(new_manager.tasks) == 1
+    assert new_manager.tasks[0]["status"] == "done"
+
+def test_journal_replay_idempotent(task_manager: TaskManager, capsys: CaptureFixture[str]) -> None:
+    """Test that replaying an already-compacted add does not duplicate the task."""
+    task_manager.add_task("Test Task 1")
+    task_manager.save_tasks()
+    with Path("test_tasks.log").open("a") as file:
+        file.write(json.dumps({"op": "add", "task": task_manager.tasks[0]}) + "\n")
+    new_manager = TaskManager(tasks_file="test_tasks.json")
+    assert len(new_manager.tasks) == 1
+    capsys.readouterr()
+    new_manager.list_tasks(status="todo")
+    captured = capsys.readouterr()
+    assert captured.out.count("Test Task 1") == 1
+
+def test_journal_replay_torn_line(task_manager: TaskManager) -> None:
+    """Test that a torn final journal line does not break loading."""
+    task_manager.add_task("Test Task 1")
+    task_manager.save_tasks()
+    task_manager.mark_task_done(1)
+    with Path("test_tasks.log").open("a") as file:
+        file.write('{"op": "add", "task": {"id": 9')
+    new_manager = TaskManager(tasks_file="test_tasks.json")
+    assert len(new_manager.tasks) == 1
+    assert new_manager.tasks[0]["status"] == "done"
+
+def test_compact_preserves_corrupt_tasks_file(capsys: CaptureFixture[str]) -> None:
+    """Test that a corrupt tasks file is never overwritten by compaction."""
+    Path("test_tasks.json").write_text("not valid json")
+    manager = TaskManager(tasks_file="test_tasks.json")
+    manager.list_tasks()
+    captured = capsys.readouterr()
+    assert "Error: The tasks file contains invalid JSON." in captured.out
+    manager.compact()
+    assert Path("test_tasks.json").read_text() == "not valid json"
+
 # Clean up the test file after tests
 @pytest.fixture(scope="module", autouse=True)
 def cleanup(request: pytest.FixtureRequest) -> None:
     """Fixture to clean up the test file after tests."""
     def remove_test_file() -> None:
         Path("test_tasks.json").unlink(missing_ok=True)
+        Path("test_tasks.log").unlink(missing_ok=True)
+        Path("test_tasks.cache").unlink(missing_ok=True)
     request.addfinalizer(remove_test_file)